@@ -1,9 +1,13 @@
 """
 Authentication API endpoints - OAuth2 callbacks and login.
 """
+import asyncio
+
 from fastapi import APIRouter, Request, HTTPException, Depends
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
 from ..config import get_db
@@ -38,7 +42,7 @@ async def steam_login():
 @router.get("/auth/steam/callback")
 async def steam_callback(
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> LoginResponse:
     """
     Handle Steam OpenID callback.
@@ -57,42 +61,60 @@ async def steam_callback(
     """
     # Convert query params to dict
     query_params = dict(request.query_params)
-    
-    # Verify callback with Steam
-    steam_id = await SteamProvider.verify_callback(query_params)
-    
+
+    # The Steam ID is readable from claimed_id before verification, so
+    # the profile fetch can run speculatively in parallel with the
+    # verify round-trip - its result is discarded if verification fails
+    claimed_steam_id = SteamProvider.extract_steam_id(
+        query_params.get("openid.claimed_id", "")
+    )
+
+    if not claimed_steam_id:
+        raise HTTPException(status_code=401, detail="Steam verification failed")
+
+    steam_id, user_info = await asyncio.gather(
+        SteamProvider.verify_callback(query_params),
+        SteamProvider.get_user_info(claimed_steam_id),
+    )
+
     if not steam_id:
         raise HTTPException(status_code=401, detail="Steam verification failed")
-    
-    # Get user info from Steam API
-    user_info = await SteamProvider.get_user_info(steam_id)
-    
+
     if not user_info:
         raise HTTPException(status_code=500, detail="Failed to fetch Steam user info")
     
-    # Check if user exists, create if not
-    user = db.query(User).filter(User.steam_id == steam_id).first()
-    
-    if not user:
-        user = User(
+    # Create or update the user in a single UPSERT - one round-trip, and
+    # no lookup-then-insert race under concurrent logins
+    insert = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+    stmt = (
+        insert(User)
+        .values(
             steam_id=steam_id,
             username=user_info["username"],
             avatar_url=user_info["avatar_url"],
         )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-    else:
-        # Update user info
-        user.username = user_info["username"]
-        user.avatar_url = user_info["avatar_url"]
-        db.commit()
+        .on_conflict_do_update(
+            index_elements=["steam_id"],
+            set_={
+                "username": user_info["username"],
+                "avatar_url": user_info["avatar_url"],
+            },
+        )
+        # Only the columns the response needs - avoids materializing a
+        # full ORM row including the wide access-token TEXT fields
+        .returning(User.id, User.username)
+    )
+    user = (await db.execute(stmt)).one()
+    await db.commit()
     
     # Create JWT token
     access_token = create_access_token(user.id, "steam")
     
-    return LoginResponse(
+    # model_construct skips pydantic validation - every field here comes
+    # from our own trusted code
+    return LoginResponse.model_construct(
         access_token=access_token,
+        token_type="bearer",
         user_id=user.id,
         username=user.username,
     )
@@ -2,9 +2,13 @@
 JWT token generation and validation for authentication.
 """
 from datetime import datetime, timedelta, timezone
+from functools import cache
 from typing import Optional
 import os
-from jose import JWTError, jwt
+import threading
+import time
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
 from pydantic import BaseModel
 
 # Configuration
@@ -13,11 +17,41 @@ ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
 
+@cache
+def _load_keys():
+    """
+    Load signing/verification keys once, on first use.
+
+    Re-parsing a PEM key on every encode/decode runs RSA sanity checks
+    that cost milliseconds per call; loading the key object once skips
+    that on every request. HS* keys are just encoded to bytes up front.
+    Deferring to first call (rather than import) keeps the cryptography
+    import out of app cold-start.
+
+    Returns:
+        (signing_key, verification_key) tuple
+    """
+    if ALGORITHM.startswith("HS"):
+        key = SECRET_KEY.encode()
+        return key, key
+
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+    private_key = load_pem_private_key(SECRET_KEY.encode(), password=None)
+    return private_key, private_key.public_key()
+
+# Decoded-token cache - verification runs on every authenticated request, so
+# repeat calls with the same token skip the signature check entirely.
+# FastAPI dispatches sync dependencies across a threadpool, hence the lock.
+_TOKEN_CACHE = TTLCache(maxsize=10_000, ttl=60)
+_TOKEN_CACHE_LOCK = threading.RLock()
+
+
 class TokenData(BaseModel):
     """JWT token payload."""
     user_id: int
     provider: str  # "steam" or "gog"
-    exp: datetime
+    exp: int  # Unix timestamp, as carried in the token
 
 
 def create_access_token(user_id: int, provider: str, expires_delta: Optional[timedelta] = None) -> str:
@@ -32,42 +66,62 @@ def create_access_token(user_id: int, provider: str, expires_delta: Optional[tim
     Returns:
         JWT token string
     """
+    import jwt  # deferred - keeps PyJWT out of app cold-start
+
     if expires_delta is None:
         expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    
+
     expire = datetime.now(timezone.utc) + expires_delta
     to_encode = {
         "user_id": user_id,
         "provider": provider,
         "exp": expire,
     }
-    
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+    signing_key, _ = _load_keys()
+    encoded_jwt = jwt.encode(to_encode, signing_key, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+@cached(_TOKEN_CACHE, key=lambda token: hashkey(token), lock=_TOKEN_CACHE_LOCK)
+def _decode_token(token: str) -> Optional[TokenData]:
+    """Decode and verify a token, caching the result by token string."""
+    import jwt  # deferred - keeps PyJWT out of app cold-start
+
+    _, verification_key = _load_keys()
+    try:
+        payload = jwt.decode(
+            token,
+            verification_key,
+            algorithms=[ALGORITHM],
+            options={"require": ["user_id", "provider", "exp"]},
+        )
+        # model_construct skips pydantic validation - the payload just
+        # passed signature verification, so the claims are trusted.
+        return TokenData.model_construct(
+            user_id=payload["user_id"],
+            provider=payload["provider"],
+            exp=payload["exp"],
+        )
+    except jwt.PyJWTError:
+        return None
+
+
 def verify_access_token(token: str) -> Optional[TokenData]:
     """
     Verify JWT token.
-    
+
     Args:
         token: JWT token string
-    
+
     Returns:
         TokenData if valid, None if invalid
     """
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("user_id")
-        provider = payload.get("provider")
-        
-        if user_id is None or provider is None:
-            return None
-        
-        return TokenData(
-            user_id=user_id,
-            provider=provider,
-            exp=datetime.fromtimestamp(payload.get("exp"))
-        )
-    except JWTError:
+    token_data = _decode_token(token)
+
+    # Re-check expiry outside the cache so a cached entry never outlives
+    # the token's real expiry.
+    if token_data is not None and token_data.exp < time.time():
         return None
+
+    return token_data
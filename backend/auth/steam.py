@@ -3,11 +3,12 @@ Steam OAuth2 provider implementation.
 
 Handles Steam OpenID login and token exchange.
 """
+import asyncio
 import os
-import httpx
+import orjson
+from cachetools import TTLCache
 from typing import Optional, Tuple
 import xml.etree.ElementTree as ET
-import re
 from urllib.parse import urlencode, parse_qs, urlparse
 
 STEAM_OPENID_URL = "https://steamcommunity.com/openid/login"
@@ -15,6 +16,142 @@ STEAM_API_KEY = os.getenv("STEAM_API_KEY")
 STEAM_API_URL = "https://api.steampowered.com"
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
 
+# Shared HTTP client - keeps pooled TLS connections to Steam alive across
+# requests instead of paying a fresh handshake per call. Created lazily
+# on first use so the httpx import stays out of app cold-start; closed
+# on app shutdown via close_http_client().
+_CLIENT = None
+
+
+def _get_client():
+    """Get the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        import httpx
+
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _CLIENT
+
+
+async def close_http_client():
+    """Close the shared HTTP client. Call on app shutdown."""
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+
+
+# Profile info cache - Steam usernames/avatars change rarely, so repeat
+# logins within the TTL skip the round-trip to api.steampowered.com.
+# Only successful lookups are cached; failures are retried. TTLCache
+# bounds the size and evicts expired entries, so it cannot grow with
+# the number of distinct users.
+_USER_INFO_CACHE = TTLCache(maxsize=10_000, ttl=300)
+_USER_INFO_LOCK = asyncio.Lock()
+
+class SteamBatcher:
+    """
+    Coalesces GetPlayerSummaries lookups into batched Steam API calls.
+
+    Steam accepts up to 100 comma-separated IDs per call, so lookups that
+    arrive within the batch window share one HTTP round-trip and one unit
+    of API-key quota. Each caller awaits a Future fanned back by steam_id.
+    All state is only touched from the event loop, so no lock is needed.
+    """
+
+    BATCH_WINDOW = 0.01  # seconds to wait for more IDs before flushing
+    BATCH_SIZE = 100  # Steam's per-call maximum
+
+    def __init__(self):
+        self._pending = {}  # steam_id -> Future
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def get(self, steam_id: str) -> Optional[dict]:
+        """Look up one player summary, coalescing with concurrent lookups."""
+        future = self._pending.get(steam_id)
+
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[steam_id] = future
+
+            if len(self._pending) >= self.BATCH_SIZE:
+                asyncio.ensure_future(self._flush())
+            elif self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.ensure_future(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.BATCH_WINDOW)
+        await self._flush()
+
+    async def _flush(self):
+        pending, self._pending = self._pending, {}
+
+        if not pending:
+            return
+
+        # A burst can enqueue more than BATCH_SIZE IDs before this task
+        # runs, so chunk the drained map into per-call groups rather
+        # than exceeding Steam's 100-ID limit in one request
+        items = list(pending.items())
+
+        for start in range(0, len(items), self.BATCH_SIZE):
+            batch = dict(items[start:start + self.BATCH_SIZE])
+
+            try:
+                players = await self._fetch_batch(list(batch))
+            except Exception as exc:
+                for future in batch.values():
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            for steam_id, future in batch.items():
+                if not future.done():
+                    future.set_result(players.get(steam_id))
+
+    @staticmethod
+    async def _fetch_batch(steam_ids: list) -> dict:
+        """Fetch one GetPlayerSummaries call for up to 100 IDs."""
+        params = {
+            "key": STEAM_API_KEY,
+            "steamids": ",".join(steam_ids),
+        }
+
+        response = await _get_client().get(
+            f"{STEAM_API_URL}/ISteamUser/GetPlayerSummaries/v2",
+            params=params,
+        )
+
+        if response.status_code != 200:
+            return {}
+
+        # orjson over raw bytes skips httpx's charset detection and is
+        # several times faster than stdlib json on large batch responses
+        try:
+            players = orjson.loads(response.content)["response"]["players"]
+        except (KeyError, orjson.JSONDecodeError):
+            return {}
+
+        return {player["steamid"]: player for player in players}
+
+
+_BATCHER = SteamBatcher()
+
+# The login URL only depends on BACKEND_URL, which is fixed for the
+# process lifetime - build it once instead of re-encoding per request.
+_LOGIN_URL = f"{STEAM_OPENID_URL}?" + urlencode({
+    "openid.ns": "http://specs.openid.net/auth/2.0",
+    "openid.mode": "checkid_setup",
+    "openid.return_to": f"{BACKEND_URL}/auth/steam/callback",
+    "openid.realm": BACKEND_URL,
+    "openid.identity": "http://specs.openid.net/auth/2.0/identifier_select",
+    "openid.claimed_id": "http://specs.openid.net/auth/2.0/identifier_select",
+})
+
 
 class SteamProvider:
     """Steam OpenID provider for authentication."""
@@ -27,16 +164,25 @@ class SteamProvider:
         Returns:
             Steam login URL for redirect
         """
-        params = {
-            "openid.ns": "http://specs.openid.net/auth/2.0",
-            "openid.mode": "checkid_setup",
-            "openid.return_to": f"{BACKEND_URL}/auth/steam/callback",
-            "openid.realm": BACKEND_URL,
-            "openid.identity": "http://specs.openid.net/auth/2.0/identifier_select",
-            "openid.claimed_id": "http://specs.openid.net/auth/2.0/identifier_select",
-        }
-        return f"{STEAM_OPENID_URL}?{urlencode(params)}"
+        return _LOGIN_URL
     
+    @staticmethod
+    def extract_steam_id(claimed_id: str) -> Optional[str]:
+        """
+        Extract the Steam ID from an OpenID claimed_id URL.
+
+        The URL always ends in ".../openid/id/<steamid>", so a plain
+        string split beats regex.
+
+        Args:
+            claimed_id: The openid.claimed_id URL from Steam
+
+        Returns:
+            Steam ID if present, None otherwise
+        """
+        steam_id = claimed_id.rpartition("/")[2]
+        return steam_id if steam_id.isdigit() else None
+
     @staticmethod
     async def verify_callback(query_params: dict) -> Optional[str]:
         """
@@ -60,62 +206,55 @@ class SteamProvider:
                 verification_params[key] = value
         
         # Verify with Steam
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                STEAM_OPENID_URL,
-                data=verification_params,
-                timeout=10
-            )
-        
+        response = await _get_client().post(STEAM_OPENID_URL, data=verification_params)
+
         if response.status_code != 200 or "is_valid:true" not in response.text:
             return None
         
         # Extract Steam ID from claimed_id
-        claimed_id = query_params.get("openid.claimed_id", "")
-        match = re.search(r"steamid/(\d+)$", claimed_id)
-        
-        if match:
-            return match.group(1)
-        
-        return None
+        return SteamProvider.extract_steam_id(query_params.get("openid.claimed_id", ""))
     
     @staticmethod
     async def get_user_info(steam_id: str) -> Optional[dict]:
         """
-        Get user profile information from Steam API.
-        
+        Get user profile information from Steam API, cached for a short TTL.
+
         Args:
             steam_id: Steam ID (e.g., "76561198123456789")
-        
+
         Returns:
             User info dict or None if error
         """
+        async with _USER_INFO_LOCK:
+            cached = _USER_INFO_CACHE.get(steam_id)
+            if cached is not None:
+                return cached
+
+        info = await SteamProvider._fetch_user_info(steam_id)
+
+        if info is not None:
+            async with _USER_INFO_LOCK:
+                _USER_INFO_CACHE[steam_id] = info
+
+        return info
+
+    @staticmethod
+    async def invalidate_user_info(steam_id: str) -> None:
+        """Drop a cached profile, forcing the next lookup to hit Steam."""
+        async with _USER_INFO_LOCK:
+            _USER_INFO_CACHE.pop(steam_id, None)
+
+    @staticmethod
+    async def _fetch_user_info(steam_id: str) -> Optional[dict]:
+        """Fetch user profile information from the Steam API."""
         if not STEAM_API_KEY:
             return None
-        
-        params = {
-            "key": STEAM_API_KEY,
-            "steamids": steam_id,
-            "include_applist": 1,
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{STEAM_API_URL}/ISteamUser/GetPlayerSummaries/v2",
-                params=params,
-                timeout=10
-            )
-        
-        if response.status_code != 200:
-            return None
-        
-        data = response.json()
-        players = data.get("response", {}).get("players", [])
-        
-        if not players:
+
+        player = await _BATCHER.get(steam_id)
+
+        if not player:
             return None
-        
-        player = players[0]
+
         return {
             "steam_id": steam_id,
             "username": player.get("personaname"),
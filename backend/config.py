@@ -1,50 +1,70 @@
 """
 Configuration and database setup for the Integ backend.
 
-Uses SQLAlchemy with SQLite for development, PostgreSQL for production.
+Uses async SQLAlchemy - SQLite (aiosqlite) for development,
+PostgreSQL (asyncpg) for production - so DB calls never block the
+event loop under concurrent requests.
 """
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import StaticPool
 import os
 
 # Database URL from environment (.env) or default to SQLite
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./integ.db")
 
+# Normalize sync-style URLs onto their async drivers
+if DATABASE_URL.startswith("sqlite://"):
+    DATABASE_URL = DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+elif DATABASE_URL.startswith("postgresql://"):
+    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
 # SQLAlchemy engine configuration
 if DATABASE_URL.startswith("sqlite"):
     # SQLite for development - use StaticPool for in-memory usage
-    engine = create_engine(
+    engine = create_async_engine(
         DATABASE_URL,
-        connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
-        poolclass=StaticPool if "sqlite" in DATABASE_URL else None,
+        poolclass=StaticPool,
+        query_cache_size=1200,
     )
 else:
     # PostgreSQL for production
-    engine = create_engine(
+    engine = create_async_engine(
         DATABASE_URL,
         pool_pre_ping=True,
         pool_size=20,
         max_overflow=10,
+        query_cache_size=1200,
     )
 
+if DATABASE_URL.startswith("sqlite"):
+    # WAL lets readers run concurrently with a writer, and
+    # synchronous=NORMAL drops one fsync per commit - both safe for dev
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 # Base class for ORM models
 Base = declarative_base()
 
 
-def get_db():
+async def get_db():
     """Dependency for FastAPI to get database session."""
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # Create all tables on startup (development only)
-def init_db():
+async def init_db():
     """Initialize database tables. Call on app startup."""
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
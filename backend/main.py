@@ -13,6 +13,7 @@ from contextlib import asynccontextmanager
 # Import database initialization
 from .config import init_db
 from .api import auth
+from .auth.steam import close_http_client
 
 # Lifespan context for startup/shutdown
 @asynccontextmanager
@@ -20,10 +21,11 @@ async def lifespan(app: FastAPI):
     """Handle app startup and shutdown."""
     # Startup
     print("🚀 Integ Backend starting...")
-    init_db()  # Create tables if they don't exist
+    await init_db()  # Create tables if they don't exist
     print("✅ Database initialized")
     yield
     # Shutdown
+    await close_http_client()
     print("⛔ Integ Backend shutting down...")
 
 
@@ -50,6 +52,10 @@ production_origins = os.getenv("ALLOWED_ORIGINS", "").split(",")
 if production_origins and production_origins[0]:
     allowed_origins.extend(production_origins)
 
+# Normalize and dedupe; frozenset gives O(1) membership checks in the
+# CORS middleware as the production origin list grows
+allowed_origins = frozenset(origin.strip().lower() for origin in allowed_origins if origin.strip())
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -106,10 +112,24 @@ async def not_found_exception_handler(request, exc):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
+
+    if os.getenv("ENV") == "production":
+        # uvloop + httptools swap asyncio's loop and h11's HTTP parser
+        # for their C implementations; one worker per core
+        uvicorn.run(
+            "backend.main:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            workers=os.cpu_count(),
+            log_level="info"
+        )
+    else:
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level="info"
+        )
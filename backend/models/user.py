@@ -3,7 +3,10 @@ Database models for Integ backend.
 
 User, Game, Library, ProtonVersion models using SQLAlchemy ORM.
 """
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import (
+    Column, Integer, String, DateTime, Boolean, ForeignKey, Text,
+    Index, UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -14,10 +17,16 @@ from ..config import Base
 class User(Base):
     """User model - Steam/GOG profiles."""
     __tablename__ = "users"
+    # Named unique constraints double as ON CONFLICT targets for the
+    # login UPSERT paths (and build btree indexes for lookups).
+    __table_args__ = (
+        UniqueConstraint("steam_id", name="uq_users_steam_id"),
+        UniqueConstraint("gog_id", name="uq_users_gog_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    steam_id = Column(String(50), unique=True, nullable=True, index=True)
-    gog_id = Column(String(50), unique=True, nullable=True, index=True)
+    steam_id = Column(String(50), nullable=True)
+    gog_id = Column(String(50), nullable=True)
     
     # User info from Steam/GOG
     username = Column(String(255))
@@ -41,6 +50,16 @@ class User(Base):
 class Game(Base):
     """Game model - Available games from Steam/GOG."""
     __tablename__ = "games"
+    # Library-sync lookups probe by (user, provider, provider game id);
+    # the composite unique index answers them directly and prevents
+    # duplicate rows per user/game.
+    __table_args__ = (
+        Index(
+            "ix_games_user_provider_gid",
+            "user_id", "provider", "provider_game_id",
+            unique=True,
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), index=True)